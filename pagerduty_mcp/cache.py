@@ -0,0 +1,145 @@
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from pagerduty import RestApiV2Client
+from pagerduty.errors import HttpError
+
+logger = logging.getLogger(__name__)
+
+
+def _float_env(name: str, default: float) -> float:
+    """Read a number of seconds from the environment, falling back to the default if it is malformed.
+
+    Args:
+        name: The environment variable to read
+        default: The value used when the variable is unset or not a number
+
+    Returns:
+        The parsed value
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r, using %s", name, value, default)
+        return default
+
+
+CACHE_TTL = _float_env("PAGERDUTY_CACHE_TTL", 15)
+CACHE_STALE_TTL = _float_env("PAGERDUTY_CACHE_STALE_TTL", 300)
+CACHE_MAXSIZE = 512
+
+CacheKey = tuple[Hashable, ...]
+
+
+class TTLCache:
+    """Thread-safe LRU mapping whose entries expire a fixed number of seconds after being stored.
+
+    A ttl of zero or less disables the cache: nothing is stored and every lookup misses.
+    Expired entries are kept for a further stale_ttl seconds so callers can fall back to them
+    when a fresh value can't be fetched.
+    """
+
+    def __init__(self, *, maxsize: int = CACHE_MAXSIZE, ttl: float = CACHE_TTL, stale_ttl: float = CACHE_STALE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = max(stale_ttl, 0)
+        self._entries: OrderedDict[CacheKey, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey, *, allow_stale: bool = False) -> tuple[bool, Any]:
+        """Look up a key.
+
+        Args:
+            key: The cache key
+            allow_stale: Also return entries that expired less than stale_ttl seconds ago
+
+        Returns:
+            A ``(hit, value)`` tuple. ``value`` is None on a miss or an expired entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            now = time.monotonic()
+            if expires_at + self.stale_ttl <= now:
+                del self._entries[key]
+                return False, None
+            if expires_at <= now and not allow_stale:
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def set(self, key: CacheKey, value: Any) -> None:
+        """Store a value, evicting the least recently used entries beyond maxsize."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, predicate: Callable[[CacheKey], bool]) -> None:
+        """Remove every entry whose key matches the predicate."""
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+response_cache = TTLCache()
+
+
+def cached_rget(client: RestApiV2Client, path: str) -> Any:
+    """Get a single resource, reusing a recent response fetched with the same credentials.
+
+    Entries are keyed on the API host and key as well as the path, so responses are never
+    shared between the tenants of a remote MCP server. If PagerDuty answers with a 5xx error,
+    a recently expired response is returned instead of failing the tool call.
+
+    Args:
+        client: The PagerDuty API client
+        path: The resource path to request (e.g., "/event_orchestrations/{id}")
+
+    Returns:
+        The unwrapped response body
+    """
+    key = (client.url, client.api_key, path)
+    hit, response = response_cache.get(key)
+    if hit:
+        return response
+    try:
+        response = client.rget(path)
+    except HttpError as e:
+        # The client only raises ServerHttpError for a plain 500, so check the status directly
+        if e.response is None or e.response.status_code < 500:
+            raise
+        hit, response = response_cache.get(key, allow_stale=True)
+        if not hit:
+            raise
+        logger.warning("PagerDuty returned %s for %s, serving a stale cached response", e.response.status_code, path)
+        return response
+    response_cache.set(key, response)
+    return response
+
+
+def invalidate(path: str) -> None:
+    """Drop cached responses for a resource path, for every client.
+
+    Args:
+        path: The resource path that was modified
+    """
+    response_cache.discard(lambda key: key[-1] == path)
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, ConfigDict, Field
 
 from pagerduty_mcp.models.base import DEFAULT_PAGINATION_LIMIT, MAXIMUM_PAGINATION_LIMIT
 from pagerduty_mcp.models.references import TeamReference, UserReference
@@ -14,6 +14,9 @@ class EventOrchestrationIntegration(BaseModel):
 
 
 class EventOrchestration(BaseModel):
+    # Fields with defaults are always serialized, so the output schema lists them as required (including type)
+    model_config = ConfigDict(json_schema_serialization_defaults_required=True)
+
     id: str = Field(description="ID of the Orchestration.", json_schema_extra={"readOnly": True})
     self: str = Field(
         description="The API show URL at which the object is accessible", json_schema_extra={"readOnly": True}
@@ -49,11 +52,10 @@ class EventOrchestration(BaseModel):
     version: str | None = Field(
         description="Version of the Orchestration.", json_schema_extra={"readOnly": True}, default=None
     )
-
-    @computed_field
-    @property
-    def type(self) -> Literal["event_orchestration"]:
-        return "event_orchestration"
+    # A constant field rather than a computed_field, so serializing large lists doesn't call a property per item
+    type: Literal["event_orchestration"] = Field(
+        default="event_orchestration", frozen=True, json_schema_extra={"readOnly": True}
+    )
 
 
 class EventOrchestrationQuery(BaseModel):
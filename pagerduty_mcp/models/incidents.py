@@ -1,5 +1,6 @@
+from collections.abc import Callable
 from datetime import datetime
-from typing import Any, Literal
+from typing import Any, ClassVar, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, computed_field, model_validator
 
@@ -76,26 +77,25 @@ class IncidentQuery(BaseModel):
             )
         return data
 
+    # (attribute, API query parameter, optional value converter), in request order
+    _PARAM_MAP: ClassVar[tuple[tuple[str, str, Callable[[Any], Any] | None], ...]] = (
+        ("status", "statuses[]", None),
+        ("since", "since", datetime.isoformat),
+        ("until", "until", datetime.isoformat),
+        ("service_ids", "service_ids[]", None),
+        ("teams_ids", "teams_ids[]", None),
+        ("user_ids", "user_ids[]", None),
+        ("urgencies", "urgencies[]", None),
+        ("sort_by", "sort_by", ",".join),
+    )
+
     # TODO: Create parent class and generalize the to_params method
     def to_params(self) -> dict[str, Any]:
-        params = {}
-        if self.status:
-            params["statuses[]"] = self.status
-        if self.since:
-            params["since"] = self.since.isoformat()
-        if self.until:
-            params["until"] = self.until.isoformat()
-        if self.service_ids:
-            params["service_ids[]"] = self.service_ids
-        if self.teams_ids:
-            params["teams_ids[]"] = self.teams_ids
-        if self.user_ids:
-            params["user_ids[]"] = self.user_ids
-        if self.urgencies:
-            params["urgencies[]"] = self.urgencies
-        if self.sort_by:
-            params["sort_by"] = ",".join(self.sort_by)
-        return params
+        return {
+            param: convert(value) if convert else value
+            for attr, param, convert in self._PARAM_MAP
+            if (value := getattr(self, attr))
+        }
 
 
 # TODO: This should be moved to its own file
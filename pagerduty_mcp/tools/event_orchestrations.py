@@ -1,3 +1,6 @@
+from pydantic import TypeAdapter
+
+from pagerduty_mcp.cache import cached_rget, invalidate
 from pagerduty_mcp.client import get_client
 from pagerduty_mcp.models import (
     EventOrchestration,
@@ -7,7 +10,10 @@ from pagerduty_mcp.models import (
     EventOrchestrationRuleCreateRequest,
     ListResponseModel,
 )
-from pagerduty_mcp.utils import paginate
+from pagerduty_mcp.utils import iter_paginate_pages
+
+_event_orchestration_list = TypeAdapter(list[EventOrchestration])
+_EventOrchestrationListResponse = ListResponseModel[EventOrchestration]
 
 
 def list_event_orchestrations(query_model: EventOrchestrationQuery) -> ListResponseModel[EventOrchestration]:
@@ -19,9 +25,14 @@ def list_event_orchestrations(query_model: EventOrchestrationQuery) -> ListRespo
     Returns:
         List of event orchestrations matching the query parameters
     """
-    response = paginate(client=get_client(), entity="event_orchestrations", params=query_model.to_params())
-    orchestrations = [EventOrchestration(**orchestration) for orchestration in response]
-    return ListResponseModel[EventOrchestration](response=orchestrations)
+    pages = iter_paginate_pages(client=get_client(), entity="event_orchestrations", params=query_model.to_params())
+    # Validate each page as it arrives so its raw API dicts can be released before the next page is
+    # converted. Pages are iterated here rather than inside pydantic so API errors propagate as-is
+    # instead of being wrapped in a ValidationError.
+    orchestrations: list[EventOrchestration] = []
+    for page in pages:
+        orchestrations.extend(_event_orchestration_list.validate_python(page))
+    return _EventOrchestrationListResponse(response=orchestrations)
 
 
 def get_event_orchestration(orchestration_id: str) -> EventOrchestration:
@@ -33,7 +44,7 @@ def get_event_orchestration(orchestration_id: str) -> EventOrchestration:
     Returns:
         The event orchestration details
     """
-    response = get_client().rget(f"/event_orchestrations/{orchestration_id}")
+    response = cached_rget(get_client(), f"/event_orchestrations/{orchestration_id}")
 
     if isinstance(response, dict) and "orchestration" in response:
         return EventOrchestration.model_validate(response["orchestration"])
@@ -50,7 +61,7 @@ def get_event_orchestration_router(orchestration_id: str) -> EventOrchestrationR
     Returns:
         The event orchestration router configuration
     """
-    response = get_client().rget(f"/event_orchestrations/{orchestration_id}/router")
+    response = cached_rget(get_client(), f"/event_orchestrations/{orchestration_id}/router")
 
     return EventOrchestrationRouter.from_api_response(response)
 
@@ -67,7 +78,9 @@ def update_event_orchestration_router(
     Returns:
         The updated event orchestration router configuration
     """
-    response = get_client().rput(f"/event_orchestrations/{orchestration_id}/router", json=router_update.model_dump())
+    path = f"/event_orchestrations/{orchestration_id}/router"
+    response = get_client().rput(path, json=router_update.model_dump())
+    invalidate(path)
 
     return EventOrchestrationRouter.from_api_response(response)
 
@@ -89,6 +102,8 @@ def append_event_orchestration_router_rule(
     """
     from pagerduty_mcp.models.event_orchestrations import EventOrchestrationRule
 
+    # Always start from the live configuration so a cached read can't drop concurrent changes
+    invalidate(f"/event_orchestrations/{orchestration_id}/router")
     current_router = get_event_orchestration_router(orchestration_id)
 
     if not current_router.orchestration_path or not current_router.orchestration_path.sets:
@@ -1,7 +1,17 @@
-from pagerduty import RestApiV2Client
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import batched, islice, repeat
+from warnings import warn
+
+from pagerduty import RestApiV2Client, entity_wrappers, successful_response, try_decoding, unwrap
 from pagerduty.errors import HttpError
 
 from pagerduty_mcp.models import MAX_RESULTS, MCPContext, User
+from pagerduty_mcp.models.base import MAXIMUM_PAGINATION_LIMIT
+
+PARALLEL_PAGINATION_WORKERS = 8
+# PagerDuty rejects classic pagination requests where offset + limit exceeds this value
+CLASSIC_PAGINATION_MAX_OFFSET = 10000
 
 
 def get_mcp_context(client: RestApiV2Client) -> MCPContext:
@@ -24,6 +34,104 @@ def get_mcp_context(client: RestApiV2Client) -> MCPContext:
         return MCPContext(user=None)
 
 
+def iter_paginate(
+    *,
+    client: RestApiV2Client,
+    entity: str,
+    params: dict,
+    maximum_records: int = MAX_RESULTS,
+) -> Iterator[dict]:
+    """Lazily paginate results.
+
+    Yield the results of a request to the PagerDuty API one record at a time, fetching further pages
+    only as they are consumed, and stop once the maximum number of records is reached.
+
+    Args:
+        client: The PagerDuty API client
+        entity: The entity to paginate through (e.g., "incidents")
+        params: The parameters to pass to the API request
+        maximum_records: The maximum number of records to return
+
+    Returns:
+        An iterator over the results
+    """
+    yield from islice(client.iter_all(entity, params=params), maximum_records)
+
+
+def iter_paginate_pages(
+    *,
+    client: RestApiV2Client,
+    entity: str,
+    params: dict,
+    maximum_records: int = MAX_RESULTS,
+) -> Iterator[list[dict]]:
+    """Paginate results one page at a time, fetching every page after the first concurrently.
+
+    The first page is requested with total=true. Once the total is known, the offsets of the remaining
+    pages (classic offset pagination only) are requested in parallel and the pages are yielded in offset
+    order. Each page is released once the caller moves on to the next, but pages that arrive ahead of
+    the caller are held until they are reached. If the API does not report a total, the remaining pages
+    are fetched sequentially.
+
+    Args:
+        client: The PagerDuty API client
+        entity: The entity to paginate through (e.g., "event_orchestrations")
+        params: The parameters to pass to the API request
+        maximum_records: The maximum number of records to return across all pages
+
+    Returns:
+        An iterator over the pages of results
+    """
+    path = f"/{entity}"
+    _, wrapper = entity_wrappers("GET", path)
+    limit = int(params.get("limit") or MAXIMUM_PAGINATION_LIMIT)
+    start = int(params.get("offset") or 0)
+
+    def fetch(offset: int, page_limit: int, *, total: bool = False) -> tuple[dict, list[dict]]:
+        page_params = {**params, "limit": page_limit, "offset": offset}
+        if total:
+            page_params["total"] = "true"
+        response = successful_response(client.get(path, params=page_params), context="classic pagination")
+        return try_decoding(response), unwrap(response, wrapper)
+
+    first_page, records = fetch(start, limit, total=True)
+    yield records[:maximum_records]
+
+    remaining = maximum_records - len(records)
+    if not records or remaining <= 0 or not first_page.get("more"):
+        return
+
+    # Like iter_all, trust the number of records actually returned over the requested limit: the API may
+    # cap it, and requesting the original limit at offsets spaced by the capped size would overlap pages.
+    step = len(records)
+    next_offset = start + step
+    if first_page.get("total") is None:
+        sequential = islice(client.iter_all(entity, params={**params, "limit": step, "offset": next_offset}), remaining)
+        yield from map(list, batched(sequential, step))
+        return
+
+    wanted = min(int(first_page["total"]), next_offset + remaining)
+    offsets = range(next_offset, min(wanted, CLASSIC_PAGINATION_MAX_OFFSET - step + 1), step)
+    reached = offsets[-1] + step if offsets else next_offset
+    if reached < wanted:
+        # Same semantics as iter_all, which warns and stops when it hits the ceiling
+        warn(
+            f"Stopping pagination of {path} at offset {reached} as offset + limit may not exceed "
+            f"{CLASSIC_PAGINATION_MAX_OFFSET}. The set of results may be incomplete.",
+            stacklevel=2,
+        )
+    if not offsets:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(PARALLEL_PAGINATION_WORKERS, len(offsets))) as executor:
+        for _, page_records in executor.map(fetch, offsets, repeat(step)):
+            page_records = page_records[:remaining]
+            yield page_records
+            remaining -= len(page_records)
+            if remaining <= 0:
+                break
+
+
 def paginate(*, client: RestApiV2Client, entity: str, params: dict, maximum_records: int = MAX_RESULTS):
     """Paginate results.
 
@@ -38,11 +146,4 @@ def paginate(*, client: RestApiV2Client, entity: str, params: dict, maximum_reco
     Returns:
         A list of results
     """
-    results = []
-    count = 0
-    for incident in client.iter_all(entity, params=params):
-        results.append(incident)
-        count += 1  # noqa: SIM113
-        if count >= maximum_records:
-            break
-    return results
+    return list(iter_paginate(client=client, entity=entity, params=params, maximum_records=maximum_records))
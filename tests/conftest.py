@@ -0,0 +1,169 @@
+from datetime import UTC, datetime
+from types import MappingProxyType
+from typing import Any
+
+import pytest
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively make a payload read-only so tests can't mutate data shared across the session."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Timestamps are stored already parsed: these payloads are inputs to tool and model tests, and
+# string parsing is covered separately by test_event_orchestration_model_with_none_values.
+_SAMPLE_TEAM = _freeze(
+    {
+        "id": "PQYP5MN",
+        "type": "team_reference",
+        "self": "https://api.pagerduty.com/teams/PQYP5MN",
+        "summary": "Engineering Team",
+    }
+)
+
+_SAMPLE_USER = _freeze(
+    {
+        "id": "P8B9WR8",
+        "self": "https://api.pagerduty.com/users/P8B9WR8",
+        "type": "user_reference",
+        "summary": "John Doe",
+    }
+)
+
+_SAMPLE_INTEGRATION = _freeze(
+    {
+        "id": "9c5ff030-12da-4204-a067-25ee61a8df6c",
+        "label": "Shopping Cart Orchestration Default Integration",
+        "parameters": {"routing_key": "R028DIE06SNKNO6V5ACSLRV7Y0TUVG7T", "type": "global"},
+    }
+)
+
+_SAMPLE_ORCHESTRATION_RESPONSE = _freeze(
+    {
+        "id": "b02e973d-9620-4e0a-9edc-00fedf7d4694",
+        "self": "https://api.pagerduty.com/event_orchestrations/b02e973d-9620-4e0a-9edc-00fedf7d4694",
+        "name": "Shopping Cart Orchestration",
+        "description": "Send shopping cart alerts to the right services",
+        "team": _SAMPLE_TEAM,
+        "integrations": [_SAMPLE_INTEGRATION],
+        "routes": 0,
+        "created_at": datetime(2021, 11, 18, 16, 42, 1, tzinfo=UTC),
+        "created_by": _SAMPLE_USER,
+        "updated_at": datetime(2021, 11, 18, 16, 42, 1, tzinfo=UTC),
+        "updated_by": _SAMPLE_USER,
+        "version": "9co0z4b152oICsoV91_PW2.ww8ip_xap",
+    }
+)
+
+_SAMPLE_ORCHESTRATIONS_LIST_RESPONSE = _freeze(
+    [
+        {
+            "id": "b02e973d-9620-4e0a-9edc-00fedf7d4694",
+            "self": "https://api.pagerduty.com/event_orchestrations/b02e973d-9620-4e0a-9edc-00fedf7d4694",
+            "name": "Shopping Cart Orchestration",
+            "description": "Send shopping cart alerts to the right services",
+            "team": _SAMPLE_TEAM,
+            "routes": 0,
+            "created_at": datetime(2021, 11, 18, 16, 42, 1, tzinfo=UTC),
+            "created_by": _SAMPLE_USER,
+            "updated_at": datetime(2021, 11, 18, 16, 42, 1, tzinfo=UTC),
+            "updated_by": _SAMPLE_USER,
+            "version": "9co0z4b152oICsoV91_PW2.ww8ip_xap",
+        },
+        {
+            "id": "a01e863d-8520-3e0a-8abc-00abcd1d2345",
+            "self": "https://api.pagerduty.com/event_orchestrations/a01e863d-8520-3e0a-8abc-00abcd1d2345",
+            "name": "Database Alerts Orchestration",
+            "description": "Route database alerts to appropriate teams",
+            "team": _SAMPLE_TEAM,
+            "routes": 2,
+            "created_at": datetime(2021, 10, 15, 10, 30, tzinfo=UTC),
+            "created_by": _SAMPLE_USER,
+            "updated_at": datetime(2021, 10, 15, 10, 30, tzinfo=UTC),
+            "updated_by": _SAMPLE_USER,
+            "version": "abc123def456ghi789jkl012mno345pqr",
+        },
+    ]
+)
+
+_SAMPLE_ROUTER_RESPONSE = _freeze(
+    {
+        "orchestration_path": {
+            "type": "router",
+            "parent": {
+                "id": "b02e973d-9620-4e0a-9edc-00fedf7d4694",
+                "self": "https://api.pagerduty.com/event_orchestrations/b02e973d-9620-4e0a-9edc-00fedf7d4694",
+                "type": "event_orchestration_reference",
+            },
+            "self": "https://api.pagerduty.com/event_orchestrations/b02e973d-9620-4e0a-9edc-00fedf7d4694/router",
+            "sets": [
+                {
+                    "id": "start",
+                    "rules": [
+                        {
+                            "label": "Events relating to our relational database",
+                            "id": "1c26698b",
+                            "conditions": [
+                                {"expression": "event.summary matches part 'database'"},
+                                {"expression": "event.source matches regex 'db[0-9]+-server'"},
+                            ],
+                            "actions": {"route_to": "PB31XBA"},
+                        },
+                        {
+                            "label": "Events relating to our www app server",
+                            "id": "d9801904",
+                            "conditions": [{"expression": "event.summary matches part 'www'"}],
+                            "actions": {"route_to": "PC2D9ML"},
+                        },
+                    ],
+                }
+            ],
+            "catch_all": {"actions": {"route_to": "unrouted"}},
+            "created_at": datetime(2021, 11, 18, 16, 42, 1, tzinfo=UTC),
+            "created_by": _SAMPLE_USER,
+            "updated_at": datetime(2021, 11, 18, 16, 42, 1, tzinfo=UTC),
+            "updated_by": _SAMPLE_USER,
+            "version": "9co0z4b152oICsoV91_PW2.ww8ip_xap",
+        }
+    }
+)
+
+
+@pytest.fixture(scope="session")
+def sample_team():
+    """Team reference shared by the sample orchestrations."""
+    return _SAMPLE_TEAM
+
+
+@pytest.fixture(scope="session")
+def sample_user():
+    """User reference used for created_by/updated_by fields."""
+    return _SAMPLE_USER
+
+
+@pytest.fixture(scope="session")
+def sample_integration():
+    """Default integration of the sample orchestration."""
+    return _SAMPLE_INTEGRATION
+
+
+@pytest.fixture(scope="session")
+def sample_orchestration_response():
+    """Single event orchestration as returned by the API."""
+    return _SAMPLE_ORCHESTRATION_RESPONSE
+
+
+@pytest.fixture(scope="session")
+def sample_orchestrations_list_response():
+    """Two event orchestrations as returned by the list endpoint."""
+    return _SAMPLE_ORCHESTRATIONS_LIST_RESPONSE
+
+
+@pytest.fixture(scope="session")
+def sample_router_response():
+    """Router configuration wrapped in ``orchestration_path``, as returned by the API."""
+    return _SAMPLE_ROUTER_RESPONSE
@@ -0,0 +1,191 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from pagerduty.errors import HttpError
+
+from pagerduty_mcp.cache import TTLCache, _float_env, cached_rget, invalidate, response_cache
+
+
+class TestFloatEnv(unittest.TestCase):
+    """Test cases for reading cache settings from the environment."""
+
+    def test_unset_variable_uses_default(self):
+        with patch.dict("os.environ", clear=True):
+            self.assertEqual(_float_env("PAGERDUTY_CACHE_TTL", 15), 15)
+
+    def test_numeric_value_is_parsed(self):
+        with patch.dict("os.environ", {"PAGERDUTY_CACHE_TTL": "2.5"}):
+            self.assertEqual(_float_env("PAGERDUTY_CACHE_TTL", 15), 2.5)
+
+    def test_malformed_value_falls_back_to_default(self):
+        """Test that a bad value logs a warning instead of failing at import."""
+        with (
+            patch.dict("os.environ", {"PAGERDUTY_CACHE_TTL": "15s"}),
+            self.assertLogs("pagerduty_mcp.cache", level="WARNING") as logs,
+        ):
+            self.assertEqual(_float_env("PAGERDUTY_CACHE_TTL", 15), 15)
+        self.assertIn("PAGERDUTY_CACHE_TTL", logs.output[0])
+
+
+class TestTTLCache(unittest.TestCase):
+    """Test cases for the TTL cache."""
+
+    def test_get_miss_and_hit(self):
+        """Test that stored values are returned until they expire."""
+        cache = TTLCache(ttl=10)
+        self.assertEqual(cache.get(("a",)), (False, None))
+
+        cache.set(("a",), {"id": "A"})
+        self.assertEqual(cache.get(("a",)), (True, {"id": "A"}))
+
+    @patch("pagerduty_mcp.cache.time.monotonic")
+    def test_entries_expire(self, mock_monotonic):
+        """Test that entries are dropped once their TTL has elapsed."""
+        cache = TTLCache(ttl=10)
+        mock_monotonic.return_value = 100.0
+        cache.set(("a",), "value")
+
+        mock_monotonic.return_value = 109.9
+        self.assertEqual(cache.get(("a",)), (True, "value"))
+
+        mock_monotonic.return_value = 110.0
+        self.assertEqual(cache.get(("a",)), (False, None))
+
+    @patch("pagerduty_mcp.cache.time.monotonic")
+    def test_stale_entries_are_returned_on_request(self, mock_monotonic):
+        """Test that expired entries stay available as stale values until stale_ttl elapses."""
+        cache = TTLCache(ttl=10, stale_ttl=60)
+        mock_monotonic.return_value = 100.0
+        cache.set(("a",), "value")
+
+        mock_monotonic.return_value = 150.0
+        self.assertEqual(cache.get(("a",)), (False, None))
+        self.assertEqual(cache.get(("a",), allow_stale=True), (True, "value"))
+
+        mock_monotonic.return_value = 170.0
+        self.assertEqual(cache.get(("a",), allow_stale=True), (False, None))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the cache never grows beyond maxsize."""
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set(("a",), 1)
+        cache.set(("b",), 2)
+        cache.get(("a",))
+        cache.set(("c",), 3)
+
+        self.assertEqual(cache.get(("a",)), (True, 1))
+        self.assertEqual(cache.get(("b",)), (False, None))
+        self.assertEqual(cache.get(("c",)), (True, 3))
+
+    def test_zero_ttl_disables_cache(self):
+        """Test that a non-positive TTL stores nothing."""
+        cache = TTLCache(ttl=0)
+        cache.set(("a",), 1)
+
+        self.assertEqual(cache.get(("a",)), (False, None))
+
+    def test_discard_and_clear(self):
+        """Test removing entries by predicate and clearing the cache."""
+        cache = TTLCache(ttl=10)
+        cache.set(("x", "/a"), 1)
+        cache.set(("y", "/a"), 2)
+        cache.set(("x", "/b"), 3)
+
+        cache.discard(lambda key: key[-1] == "/a")
+        self.assertEqual(cache.get(("x", "/a")), (False, None))
+        self.assertEqual(cache.get(("y", "/a")), (False, None))
+        self.assertEqual(cache.get(("x", "/b")), (True, 3))
+
+        cache.clear()
+        self.assertEqual(cache.get(("x", "/b")), (False, None))
+
+
+class TestCachedRget(unittest.TestCase):
+    """Test cases for cached_rget."""
+
+    def setUp(self):
+        response_cache.clear()
+
+    def tearDown(self):
+        response_cache.clear()
+
+    def _client(self, api_key):
+        client = MagicMock()
+        client.url = "https://api.pagerduty.com"
+        client.api_key = api_key
+        client.rget.return_value = {"id": api_key}
+        return client
+
+    def test_repeated_requests_hit_the_api_once(self):
+        """Test that a second request for the same path is served from the cache."""
+        client = self._client("key-1")
+
+        self.assertEqual(cached_rget(client, "/services/S1"), {"id": "key-1"})
+        self.assertEqual(cached_rget(client, "/services/S1"), {"id": "key-1"})
+
+        client.rget.assert_called_once_with("/services/S1")
+
+    def test_responses_are_not_shared_between_credentials(self):
+        """Test that clients with different API keys never see each other's responses."""
+        first = self._client("key-1")
+        second = self._client("key-2")
+
+        self.assertEqual(cached_rget(first, "/services/S1"), {"id": "key-1"})
+        self.assertEqual(cached_rget(second, "/services/S1"), {"id": "key-2"})
+
+        first.rget.assert_called_once()
+        second.rget.assert_called_once()
+
+    def test_invalidate_forces_a_fresh_request(self):
+        """Test that invalidating a path makes the next request hit the API."""
+        client = self._client("key-1")
+
+        cached_rget(client, "/services/S1")
+        invalidate("/services/S1")
+        cached_rget(client, "/services/S1")
+
+        self.assertEqual(client.rget.call_count, 2)
+
+    def _http_error(self, status_code):
+        return HttpError("error", MagicMock(status_code=status_code))
+
+    @patch("pagerduty_mcp.cache.time.monotonic")
+    def test_server_error_falls_back_to_stale_response(self, mock_monotonic):
+        """Test that an expired response is served when PagerDuty returns a 5xx error."""
+        client = self._client("key-1")
+        mock_monotonic.return_value = 100.0
+        cached_rget(client, "/services/S1")
+
+        mock_monotonic.return_value = 100.0 + response_cache.ttl
+        client.rget.side_effect = self._http_error(503)
+
+        with self.assertLogs("pagerduty_mcp.cache", level="WARNING") as logs:
+            self.assertEqual(cached_rget(client, "/services/S1"), {"id": "key-1"})
+        self.assertEqual(client.rget.call_count, 2)
+        self.assertIn("503", logs.output[0])
+        self.assertIn("/services/S1", logs.output[0])
+
+    def test_server_error_without_cached_response_is_raised(self):
+        """Test that a 5xx error propagates when there is nothing to fall back to."""
+        client = self._client("key-1")
+        client.rget.side_effect = self._http_error(502)
+
+        with self.assertRaises(HttpError):
+            cached_rget(client, "/services/S1")
+
+    @patch("pagerduty_mcp.cache.time.monotonic")
+    def test_client_error_is_raised_even_with_stale_response(self, mock_monotonic):
+        """Test that 4xx errors are never masked by a stale response."""
+        client = self._client("key-1")
+        mock_monotonic.return_value = 100.0
+        cached_rget(client, "/services/S1")
+
+        mock_monotonic.return_value = 100.0 + response_cache.ttl
+        client.rget.side_effect = self._http_error(404)
+
+        with self.assertRaises(HttpError):
+            cached_rget(client, "/services/S1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -591,6 +591,41 @@ class TestIncidentTools(unittest.TestCase):
             str(ctx.exception),
         )
 
+    def test_incidentquery_to_params_all_fields(self):
+        """Test IncidentQuery.to_params() with all fields set."""
+        since_date = datetime(2023, 1, 1)
+        until_date = datetime(2023, 1, 31)
+        query = IncidentQuery(
+            status=["triggered"],
+            since=since_date,
+            until=until_date,
+            service_ids=["SVC1"],
+            teams_ids=["TEAM1"],
+            user_ids=["USER1"],
+            urgencies=["high"],
+            sort_by=["created_at:desc", "urgency:asc"],
+        )
+
+        params = query.to_params()
+
+        expected_params = {
+            "statuses[]": ["triggered"],
+            "since": since_date.isoformat(),
+            "until": until_date.isoformat(),
+            "service_ids[]": ["SVC1"],
+            "teams_ids[]": ["TEAM1"],
+            "user_ids[]": ["USER1"],
+            "urgencies[]": ["high"],
+            "sort_by": "created_at:desc,urgency:asc",
+        }
+        self.assertEqual(params, expected_params)
+
+    def test_incidentquery_to_params_empty(self):
+        """Test IncidentQuery.to_params() omits unset and empty fields."""
+        query = IncidentQuery(status=[], service_ids=[])
+
+        self.assertEqual(query.to_params(), {})
+
 
 if __name__ == "__main__":
     unittest.main()
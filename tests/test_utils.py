@@ -0,0 +1,137 @@
+import unittest
+from unittest.mock import MagicMock
+
+from pagerduty_mcp.utils import CLASSIC_PAGINATION_MAX_OFFSET, iter_paginate, iter_paginate_pages, paginate
+
+
+class TestPagination(unittest.TestCase):
+    """Test cases for pagination helpers."""
+
+    def setUp(self):
+        self.mock_client = MagicMock()
+        self.mock_client.iter_all.return_value = iter([{"id": str(i)} for i in range(5)])
+
+    def test_paginate_stops_at_maximum_records(self):
+        """Test that paginate returns at most maximum_records results."""
+        result = paginate(client=self.mock_client, entity="services", params={"limit": 2}, maximum_records=3)
+
+        self.assertEqual(result, [{"id": "0"}, {"id": "1"}, {"id": "2"}])
+        self.mock_client.iter_all.assert_called_once_with("services", params={"limit": 2})
+
+    def test_iter_paginate_is_lazy(self):
+        """Test that iter_paginate only requests records as they are consumed."""
+        records = iter_paginate(client=self.mock_client, entity="services", params={})
+        self.mock_client.iter_all.assert_not_called()
+
+        self.assertEqual(next(records), {"id": "0"})
+        self.assertEqual(list(records), [{"id": str(i)} for i in range(1, 5)])
+        self.mock_client.iter_all.assert_called_once_with("services", params={})
+
+
+class TestParallelPagination(unittest.TestCase):
+    """Test cases for page-by-page concurrent classic pagination."""
+
+    def setUp(self):
+        self.records = [{"id": str(i)} for i in range(10)]
+        self.page_size_cap = None
+        self.mock_client = MagicMock()
+        self.mock_client.get.side_effect = self._page
+
+    def _response(self, body):
+        response = MagicMock(ok=True, status_code=200)
+        response.json.return_value = body
+        return response
+
+    def _page(self, url, params):
+        offset = params["offset"]
+        limit = min(params["limit"], self.page_size_cap or params["limit"])
+        page = self.records[offset : offset + limit]
+        body = {"orchestrations": page, "limit": limit, "offset": offset, "more": offset + limit < len(self.records)}
+        if params.get("total") == "true":
+            body["total"] = len(self.records)
+        return self._response(body)
+
+    def _records(self, pages):
+        return [record for page in pages for record in page]
+
+    def _requested(self, key):
+        return sorted(call.kwargs["params"][key] for call in self.mock_client.get.call_args_list)
+
+    def test_fetches_all_pages_in_order(self):
+        """Test that every page is fetched once and pages are yielded whole, in offset order."""
+        pages = list(iter_paginate_pages(client=self.mock_client, entity="event_orchestrations", params={"limit": 3}))
+
+        self.assertEqual(pages, [self.records[0:3], self.records[3:6], self.records[6:9], self.records[9:]])
+        self.assertEqual(self._requested("offset"), [0, 3, 6, 9])
+        first_call = self.mock_client.get.call_args_list[0]
+        self.assertEqual(first_call.args, ("/event_orchestrations",))
+        self.assertEqual(first_call.kwargs["params"], {"limit": 3, "offset": 0, "total": "true"})
+
+    def test_stops_at_maximum_records(self):
+        """Test that no pages beyond maximum_records are requested."""
+        result = self._records(
+            iter_paginate_pages(
+                client=self.mock_client,
+                entity="event_orchestrations",
+                params={"limit": 3, "offset": 2},
+                maximum_records=4,
+            )
+        )
+
+        self.assertEqual(result, self.records[2:6])
+        self.assertEqual(self._requested("offset"), [2, 5])
+
+    def test_short_first_page_sets_the_page_size(self):
+        """Test that a capped first page shrinks the limit of later requests so pages don't overlap."""
+        self.page_size_cap = 2
+
+        result = self._records(
+            iter_paginate_pages(client=self.mock_client, entity="event_orchestrations", params={"limit": 3})
+        )
+
+        self.assertEqual(result, self.records)
+        self.assertEqual(self._requested("offset"), [0, 2, 4, 6, 8])
+        self.assertEqual(self._requested("limit"), [2, 2, 2, 2, 3])
+
+    def test_stops_at_classic_pagination_offset_ceiling(self):
+        """Test that no request goes past the API's offset + limit ceiling, and that the cut is reported."""
+        self.records = [{"id": str(i)} for i in range(CLASSIC_PAGINATION_MAX_OFFSET + 500)]
+
+        with self.assertWarnsRegex(UserWarning, "may be incomplete"):
+            result = self._records(
+                iter_paginate_pages(
+                    client=self.mock_client,
+                    entity="event_orchestrations",
+                    params={"limit": 100},
+                    maximum_records=len(self.records),
+                )
+            )
+
+        self.assertEqual(result, self.records[:CLASSIC_PAGINATION_MAX_OFFSET])
+        for call in self.mock_client.get.call_args_list:
+            params = call.kwargs["params"]
+            self.assertLessEqual(params["offset"] + params["limit"], CLASSIC_PAGINATION_MAX_OFFSET)
+
+    def test_single_page_makes_one_request(self):
+        """Test that a result set that fits on one page needs a single request."""
+        result = self._records(
+            iter_paginate_pages(client=self.mock_client, entity="event_orchestrations", params={"limit": 50})
+        )
+
+        self.assertEqual(result, self.records)
+        self.mock_client.get.assert_called_once()
+
+    def test_falls_back_to_sequential_without_total(self):
+        """Test that pagination continues sequentially when the API does not report a total."""
+        self.mock_client.get.side_effect = None
+        self.mock_client.get.return_value = self._response({"orchestrations": self.records[:3], "more": True})
+        self.mock_client.iter_all.return_value = iter(self.records[3:])
+
+        pages = list(iter_paginate_pages(client=self.mock_client, entity="event_orchestrations", params={"limit": 3}))
+
+        self.assertEqual(pages, [self.records[0:3], self.records[3:6], self.records[6:9], self.records[9:]])
+        self.mock_client.iter_all.assert_called_once_with("event_orchestrations", params={"limit": 3, "offset": 3})
+
+
+if __name__ == "__main__":
+    unittest.main()